@@ -3,7 +3,8 @@ ate-dme.obst - Python SDK for Domainesia/Neva Objects S3-compatible storage
 """
 
 from .client import ObjectsClient
-from .exceptions import ObjectsError, UploadError, DownloadError, ListError
+from .client_async import AsyncObjectsClient
+from .exceptions import ObjectsError, UploadError, DownloadError, ListError, DeleteError
 
 __version__ = "0.1.0"
-__all__ = ["ObjectsClient", "ObjectsError", "UploadError", "DownloadError", "ListError"]
\ No newline at end of file
+__all__ = ["ObjectsClient", "AsyncObjectsClient", "ObjectsError", "UploadError", "DownloadError", "ListError", "DeleteError"]
\ No newline at end of file
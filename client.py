@@ -4,30 +4,75 @@ ate-dme.obst client - High-level S3-compatible client for Neva Objects.
 
 from __future__ import annotations
 
+import itertools
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from typing import List, Optional
+from datetime import datetime
+from functools import lru_cache, partial
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import boto3
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
+from botocore.auth import S3SigV4QueryAuth
+from botocore.awsrequest import AWSRequest, prepare_request_dict
 from botocore.client import Config
 from botocore.exceptions import ClientError
+from botocore.response import StreamingBody
+from botocore.utils import percent_encode
 
-from .exceptions import DownloadError, ListError, ObjectsError, UploadError
+from .exceptions import DeleteError, DownloadError, ListError, ObjectsError, UploadError
 
 DEFAULT_ENDPOINT = "https://s3.nevaobjects.id"
-
-
-@dataclass
+LIST_PAGE_SIZE = 1000  # S3's per-request maximum for ListObjectsV2
+HEX_FANOUT = "0123456789abcdef"
+PRESIGN_CACHE_SIZE = 4096
+DOUBLEWRITE_SUFFIX = ".dup"
+DELETE_BATCH_SIZE = 1000  # S3's per-request maximum for DeleteObjects
+DELETE_ERRORS_SHOWN = 5  # failed keys named in a DeleteError message
+
+# Shared boto3 sessions keyed by (access_key, endpoint). A session caches the
+# loaded service model and endpoint data, so clients created after the first
+# one skip that work. Sessions are not thread-safe, hence the lock.
+_SESSION_CACHE: Dict[Tuple[str, str], boto3.session.Session] = {}
+_SESSION_LOCK = threading.Lock()
+
+# botocore Config options shared by every client; per-client tuning is
+# layered on top in _boto_config_options.
+_BASE_BOTO_OPTIONS = {
+    "signature_version": "s3v4",
+    "s3": {"addressing_style": "path"},
+    "request_checksum_calculation": "when_required",
+    "response_checksum_validation": "when_required",
+}
+
+_get_object_fields = itemgetter("Key", "Size", "LastModified")
+_get_key = itemgetter("Key")
+
+# head_object reports a missing key as "404" or "NotFound"; GET-style calls use "NoSuchKey".
+_NOT_FOUND_CODES = frozenset({"404", "NoSuchKey", "NotFound"})
+# A ranged GET on an empty object fails with 416 even though the object exists.
+_EMPTY_RANGE_CODES = frozenset({"416", "InvalidRange"})
+
+
+@dataclass(slots=True)
 class ObjectInfo:
     """Metadata for a single object in a bucket."""
 
     key: str
     size: int
-    last_modified: str
+    last_modified: datetime
     etag: str = ""
 
     def __repr__(self) -> str:
-        return f"ObjectInfo(key={self.key!r}, size={self.size}, last_modified={self.last_modified!r})"
+        return (
+            f"ObjectInfo(key={self.key!r}, size={self.size}, "
+            f"last_modified={self.last_modified.isoformat()!r})"
+        )
 
 
 @dataclass
@@ -39,9 +84,76 @@ class ObjectsConfig:
     bucket: str
     endpoint: str = DEFAULT_ENDPOINT
     default_expiry: int = 86400  # seconds (24h)
+    multipart_threshold: int = 64 * 1024 * 1024  # bytes (64 MiB)
+    multipart_chunksize: int = 64 * 1024 * 1024  # bytes (64 MiB)
+    max_concurrency: int = 16  # parallel part uploads per file
+    max_workers: int = 16  # default thread count for batch operations
+    exists_via_get: bool = False  # probe object_exists with a 1-byte ranged GET
+    max_pool_connections: int = 64  # raised to 2x max_workers if that is larger
+    tcp_keepalive: bool = True
+    max_attempts: int = 5  # total attempts per request, including the first
+    retry_mode: str = "adaptive"  # client-side rate limiting on throttling errors
+    checksum_algorithm: Optional[str] = None  # e.g. "CRC32C"; the endpoint must support it
+    doublewrite: bool = False  # also write every upload to "<key>.dup"
     extra_boto_config: dict = field(default_factory=dict)
 
 
+def _boto_config_options(config: ObjectsConfig) -> dict:
+    """Keyword arguments for the botocore ``Config`` of a client built from ``config``."""
+    options = dict(
+        _BASE_BOTO_OPTIONS,
+        # Keep enough pooled connections for batch workers so urllib3
+        # does not discard them with "Connection pool is full".
+        max_pool_connections=max(config.max_pool_connections, config.max_workers * 2),
+        tcp_keepalive=config.tcp_keepalive,
+        retries={"total_max_attempts": config.max_attempts, "mode": config.retry_mode},
+    )
+    if config.checksum_algorithm:
+        options["request_checksum_calculation"] = "when_supported"
+    options.update(config.extra_boto_config)
+    return options
+
+
+def _upload_extra_args(config: ObjectsConfig, extra_args: Optional[dict]) -> dict:
+    """``ExtraArgs`` for an upload, adding the configured checksum algorithm."""
+    if config.checksum_algorithm:
+        return {"ChecksumAlgorithm": config.checksum_algorithm, **(extra_args or {})}
+    return extra_args or {}
+
+
+def _build_transfer_config(
+    config: ObjectsConfig, max_concurrency: Optional[int] = None
+) -> TransferConfig:
+    return TransferConfig(
+        multipart_threshold=config.multipart_threshold,
+        multipart_chunksize=config.multipart_chunksize,
+        max_concurrency=max_concurrency or config.max_concurrency,
+        use_threads=True,
+    )
+
+
+def _resolve_limit(limit: Optional[int], max_keys: Optional[int]) -> Optional[int]:
+    # ``max_keys`` is the pre-pagination name of ``list(limit=...)``.
+    if max_keys is not None:
+        if limit is not None:
+            raise TypeError("pass either 'limit' or 'max_keys', not both")
+        return max_keys
+    return limit
+
+
+def _chunked(iterable: Iterable[str], size: int) -> Iterator[List[str]]:
+    it = iter(iterable)
+    return iter(lambda: [*itertools.islice(it, size)], [])
+
+
+def _clean_etag(etag: str) -> str:
+    """Remove the double quotes S3 wraps around ETag values."""
+    if len(etag) > 1 and etag[0] == etag[-1] == '"':
+        return etag[1:-1]
+    # Some S3-compatible stores quote inconsistently.
+    return etag.strip('"')
+
+
 class ObjectsClient:
     """
     High-level client for Domainesia/Neva Objects S3-compatible storage.
@@ -74,33 +186,135 @@ class ObjectsClient:
 
     def __init__(self, config: ObjectsConfig) -> None:
         self.config = config
-        self._s3 = self._build_client()
+        self._s3_client = None
+        self._s3_lock = threading.Lock()
+        self._transfer_config = _build_transfer_config(self.config)
+        self._bucket_path = f"/{percent_encode(self.config.bucket)}/"
+        self._presign_cached = lru_cache(maxsize=PRESIGN_CACHE_SIZE)(self._presign_bucketed)
 
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
+    @property
+    def _s3(self):
+        # Built on first use so constructing a client stays cheap. Batch
+        # helpers first touch it from worker threads, hence the lock: every
+        # thread must share one client rather than each building its own.
+        if self._s3_client is None:
+            with self._s3_lock:
+                if self._s3_client is None:
+                    self._s3_client = self._build_client()
+        return self._s3_client
+
     def _build_client(self):
-        boto_config = Config(
-            signature_version="s3v4",
-            s3={"addressing_style": "path"},
-            request_checksum_calculation="when_required",
-            response_checksum_validation="when_required",
-            **self.config.extra_boto_config,
+        boto_config = Config(**_boto_config_options(self.config))
+        cache_key = (self.config.access_key, self.config.endpoint)
+        with _SESSION_LOCK:
+            session = _SESSION_CACHE.get(cache_key)
+            if session is None:
+                session = _SESSION_CACHE[cache_key] = boto3.session.Session()
+            return session.client(
+                "s3",
+                endpoint_url=self.config.endpoint,
+                aws_access_key_id=self.config.access_key,
+                aws_secret_access_key=self.config.secret_key,
+                config=boto_config,
+            )
+
+    def _presign_get(self, object_key: str, expiry: int) -> str:
+        """
+        Pre-sign a GetObject URL directly with the client's request signer.
+
+        Equivalent to ``generate_presigned_url("get_object", ...)`` but skips
+        parameter validation, serialization and endpoint resolution, which
+        botocore would otherwise redo for every URL.
+        """
+        request_dict = {
+            "url_path": self._bucket_path + percent_encode(object_key, safe="/~"),
+            "query_string": {},
+            "method": "GET",
+            "headers": {},
+            "body": b"",
+        }
+        prepare_request_dict(request_dict, endpoint_url=self._s3.meta.endpoint_url)
+        return self._s3._request_signer.generate_presigned_url(
+            request_dict, "GetObject", expires_in=expiry
         )
-        return boto3.client(
-            "s3",
-            endpoint_url=self.config.endpoint,
-            aws_access_key_id=self.config.access_key,
-            aws_secret_access_key=self.config.secret_key,
-            config=boto_config,
+
+    def _presign_bucketed(self, object_key: str, expiry: int, bucket_ts: int) -> str:
+        # ``bucket_ts`` only takes part in the cache key; see get_download_url.
+        return self._presign_get(object_key, expiry)
+
+    def _fetch(self, object_key: str) -> bytes:
+        try:
+            body = self._s3.get_object(Bucket=self.config.bucket, Key=object_key)["Body"]
+            try:
+                return body.read()
+            finally:
+                body.close()
+        except ClientError as exc:
+            code, msg = self._parse_client_error(exc)
+            raise DownloadError(
+                f"Failed to fetch '{object_key}': {msg}",
+                code=code,
+                original=exc,
+            ) from exc
+
+    def _discard(self, object_key: str) -> None:
+        """Best-effort delete used to clean up after a failed write."""
+        try:
+            self._s3.delete_object(Bucket=self.config.bucket, Key=object_key)
+        except ClientError:
+            pass
+
+    def _delete_batch(self, object_keys: List[str]) -> List[dict]:
+        """Delete up to ``DELETE_BATCH_SIZE`` keys in one request; return per-key errors."""
+        try:
+            response = self._s3.delete_objects(
+                Bucket=self.config.bucket,
+                Delete={"Objects": [{"Key": k} for k in object_keys], "Quiet": True},
+            )
+        except ClientError as exc:
+            code, msg = self._parse_client_error(exc)
+            raise ObjectsError(
+                f"Failed to delete {len(object_keys)} objects: {msg}",
+                code=code,
+                original=exc,
+            ) from exc
+        return response.get("Errors", [])
+
+    def _iter_pages(
+        self, prefix: str = "", page_size: int = LIST_PAGE_SIZE, **kwargs
+    ) -> Iterator[dict]:
+        """Yield raw ``list_objects_v2`` pages, following continuation tokens."""
+        paginator = self._s3.get_paginator("list_objects_v2")
+        pages = paginator.paginate(
+            Bucket=self.config.bucket,
+            Prefix=prefix,
+            PaginationConfig={"PageSize": page_size},
+            **kwargs,
         )
+        try:
+            yield from pages
+        except ClientError as exc:
+            code, msg = self._parse_client_error(exc)
+            raise ListError(f"Failed to list objects: {msg}", code=code, original=exc) from exc
 
     @staticmethod
     def _parse_client_error(error: ClientError) -> tuple[str, str]:
         resp = error.response.get("Error", {})
         return resp.get("Code", "Unknown"), resp.get("Message", "(no message)")
 
+    @classmethod
+    def _parse_upload_error(cls, error: Exception) -> tuple[str, str]:
+        # upload_file re-raises a failed request as S3UploadFailedError, with
+        # the original ClientError only reachable as its implicit context.
+        cause = error if isinstance(error, ClientError) else error.__context__
+        if isinstance(cause, ClientError):
+            return cls._parse_client_error(cause)
+        return "Unknown", str(error)
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -120,6 +334,14 @@ class ObjectsClient:
             extra_args: Extra arguments forwarded to boto3's ``upload_file``
                         (e.g. ``{"ContentType": "image/jpeg"}``).
 
+        Files larger than ``config.multipart_threshold`` are split into
+        ``config.multipart_chunksize`` parts and uploaded concurrently.
+        With ``config.doublewrite`` the file is also written to
+        ``object_key + ".dup"`` in parallel; see :meth:`download_with_fallback`.
+        If either write fails, the ``.dup`` copy is removed before raising.
+        When ``config.checksum_algorithm`` is set, each request carries that
+        checksum (e.g. CRC32C) for the server to verify.
+
         Returns:
             The object key that was uploaded.
 
@@ -127,31 +349,129 @@ class ObjectsClient:
             FileNotFoundError: If ``local_path`` does not exist.
             UploadError: If the upload fails.
         """
+        return self._upload(local_path, object_key, extra_args, self._transfer_config)
+
+    def _upload(
+        self,
+        local_path: str,
+        object_key: Optional[str],
+        extra_args: Optional[dict],
+        transfer_config: TransferConfig,
+    ) -> str:
         if not os.path.isfile(local_path):
             raise FileNotFoundError(f"File not found: {local_path}")
 
         key = object_key or os.path.basename(local_path)
 
+        put = partial(
+            self._s3.upload_file,
+            Filename=local_path,
+            Bucket=self.config.bucket,
+            ExtraArgs=_upload_extra_args(self.config, extra_args),
+            Config=transfer_config,
+        )
+
         try:
-            self._s3.upload_file(
-                Filename=local_path,
-                Bucket=self.config.bucket,
-                Key=key,
-                ExtraArgs=extra_args or {},
-            )
-        except ClientError as exc:
-            code, msg = self._parse_client_error(exc)
+            if self.config.doublewrite:
+                dup_key = key + DOUBLEWRITE_SUFFIX
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    futures = [pool.submit(put, Key=k) for k in (key, dup_key)]
+                errors = [f.exception() for f in futures if f.exception() is not None]
+                if errors:
+                    # Never leave a .dup that download_with_fallback could serve
+                    # for a write that failed.
+                    self._discard(dup_key)
+                    raise errors[0]
+            else:
+                put(Key=key)
+        except (ClientError, S3UploadFailedError) as exc:
+            code, msg = self._parse_upload_error(exc)
             raise UploadError(f"Upload failed for '{local_path}': {msg}", code=code, original=exc) from exc
 
         return key
 
-    def list(self, prefix: str = "", max_keys: int = 1000) -> List[ObjectInfo]:
+    def upload_many(
+        self,
+        paths: Iterable[str],
+        max_workers: Optional[int] = None,
+        extra_args: Optional[dict] = None,
+    ) -> List[Tuple[str, Union[str, Exception]]]:
+        """
+        Upload several local files concurrently, each under its filename.
+
+        All workers share this client's underlying boto3 client and its
+        connection pool. Workers and the per-file multipart concurrency are
+        capped so that, together, they never need more connections than
+        the pool holds.
+
+        Args:
+            paths: Paths to the local files.
+            max_workers: Number of parallel uploads. Defaults to ``config.max_workers``.
+            extra_args: Extra arguments forwarded to every ``upload`` call.
+
+        Returns:
+            List of ``(local_path, result)`` pairs in completion order, where
+            ``result`` is the uploaded object key or the exception raised
+            (``FileNotFoundError`` / :class:`UploadError`) for that file.
+        """
+        copies = 2 if self.config.doublewrite else 1
+        pool_size = self._s3.meta.config.max_pool_connections
+        workers = min(max_workers or self.config.max_workers, max(1, pool_size // copies))
+        part_threads = max(1, pool_size // (workers * copies))
+        transfer_config = _build_transfer_config(
+            self.config, max_concurrency=min(self.config.max_concurrency, part_threads)
+        )
+        results: List[Tuple[str, Union[str, Exception]]] = []
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(self._upload, path, None, extra_args, transfer_config): path
+                for path in paths
+            }
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    results.append((path, future.result()))
+                except (FileNotFoundError, ObjectsError) as exc:
+                    results.append((path, exc))
+
+        return results
+
+    def iter_objects(self, prefix: str = "", page_size: int = LIST_PAGE_SIZE) -> Iterator[ObjectInfo]:
+        """
+        Lazily iterate over every object in the bucket, optionally filtered by prefix.
+
+        Pages are fetched on demand, so memory stays bounded regardless of
+        how many objects the bucket holds.
+
+        Args:
+            prefix: Key prefix to filter objects.
+            page_size: Keys requested per ``ListObjectsV2`` call (at most 1000).
+
+        Yields:
+            :class:`ObjectInfo` objects, in key order.
+
+        Raises:
+            ListError: If a listing request fails.
+        """
+        for page in self._iter_pages(prefix, page_size):
+            for obj in page.get("Contents", []):
+                key, size, last_modified = _get_object_fields(obj)
+                yield ObjectInfo(key, size, last_modified, _clean_etag(obj.get("ETag", "")))
+
+    def list(
+        self,
+        prefix: str = "",
+        limit: Optional[int] = None,
+        max_keys: Optional[int] = None,
+    ) -> List[ObjectInfo]:
         """
         List objects in the bucket, optionally filtered by prefix.
 
         Args:
             prefix: Key prefix to filter objects.
-            max_keys: Maximum number of objects to return.
+            limit: Maximum number of objects to return. ``None`` returns all.
+            max_keys: Former name of ``limit``, still accepted.
 
         Returns:
             List of :class:`ObjectInfo` objects.
@@ -159,35 +479,90 @@ class ObjectsClient:
         Raises:
             ListError: If the listing request fails.
         """
-        try:
-            response = self._s3.list_objects_v2(
-                Bucket=self.config.bucket,
-                Prefix=prefix,
-                MaxKeys=max_keys,
-            )
-        except ClientError as exc:
-            code, msg = self._parse_client_error(exc)
-            raise ListError(f"Failed to list objects: {msg}", code=code, original=exc) from exc
+        limit = _resolve_limit(limit, max_keys)
+        if limit is None:
+            return [*self.iter_objects(prefix)]
+        if limit <= 0:
+            return []
+        objects = self.iter_objects(prefix, page_size=min(limit, LIST_PAGE_SIZE))
+        return [*itertools.islice(objects, limit)]
+
+    def list_parallel(
+        self,
+        prefixes: Optional[List[str]] = None,
+        prefix: str = "",
+        max_workers: Optional[int] = None,
+    ) -> List[ObjectInfo]:
+        """
+        List objects under several prefixes concurrently and merge the results.
 
-        contents = response.get("Contents", [])
-        return [
-            ObjectInfo(
-                key=obj["Key"],
-                size=obj["Size"],
-                last_modified=str(obj["LastModified"]),
-                etag=obj.get("ETag", "").strip('"'),
-            )
-            for obj in contents
-        ]
+        Each prefix is paginated independently on its own worker, so listings
+        of a bucket partitioned by key prefix are not serialized on a single
+        continuation-token chain.
+
+        Args:
+            prefixes: Explicit prefixes to list. Defaults to ``prefix`` followed
+                      by each hex digit (``"<prefix>0"`` .. ``"<prefix>f"``);
+                      keys not matching any generated prefix are skipped.
+            prefix: Base prefix used when ``prefixes`` is not given.
+            max_workers: Number of parallel listings. Defaults to ``config.max_workers``.
+
+        Returns:
+            List of :class:`ObjectInfo` objects, grouped in the order of ``prefixes``.
+
+        Raises:
+            ListError: If any listing request fails.
+        """
+        if prefixes is None:
+            prefixes = [f"{prefix}{c}" for c in HEX_FANOUT]
+        workers = max_workers or self.config.max_workers
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            chunks = pool.map(lambda p: [*self.iter_objects(p)], prefixes)
+            return [obj for chunk in chunks for obj in chunk]
 
     def list_keys(self, prefix: str = "") -> List[str]:
         """
         Convenience method that returns only object keys.
 
+        Reads keys straight from the listing pages without building
+        :class:`ObjectInfo` objects.
+
         Returns:
             List of string keys.
+
+        Raises:
+            ListError: If the listing request fails.
+        """
+        return [
+            _get_key(obj)
+            for page in self._iter_pages(prefix)
+            for obj in page.get("Contents", [])
+        ]
+
+    def list_prefixes(self, prefix: str = "", delimiter: str = "/") -> List[str]:
+        """
+        List the "folders" directly below ``prefix``.
+
+        Only the common prefixes are returned by the server, not the keys
+        beneath them, so scanning the top level of a bucket with millions
+        of keys takes a handful of requests instead of a full listing.
+
+        Args:
+            prefix: Key prefix to scan under (e.g. ``"photos/"``).
+            delimiter: Character that separates path segments in keys.
+
+        Returns:
+            List of prefixes, each ending with ``delimiter``.
+
+        Raises:
+            ListError: If the listing request fails.
         """
-        return [obj.key for obj in self.list(prefix=prefix)]
+        return [
+            common["Prefix"]
+            for page in self._iter_pages(prefix, Delimiter=delimiter)
+            for common in page.get("CommonPrefixes", [])
+        ]
 
     def get_download_url(
         self,
@@ -197,6 +572,11 @@ class ObjectsClient:
         """
         Generate a pre-signed download URL for an object.
 
+        URLs are memoized per key and expiry for a quarter of their validity
+        window, so repeated calls return the same URL and browser/CDN caches
+        can hit. A returned URL therefore stays valid for at least 75% of
+        ``expires_in``.
+
         Args:
             object_key: Key of the object in the bucket.
             expires_in: URL validity in seconds. Defaults to ``config.default_expiry``.
@@ -208,13 +588,10 @@ class ObjectsClient:
             DownloadError: If URL generation fails.
         """
         expiry = expires_in if expires_in is not None else self.config.default_expiry
+        bucket_ts = int(time.time() // max(expiry // 4, 1))
 
         try:
-            url = self._s3.generate_presigned_url(
-                "get_object",
-                Params={"Bucket": self.config.bucket, "Key": object_key},
-                ExpiresIn=expiry,
-            )
+            url = self._presign_cached(object_key, expiry, bucket_ts)
         except ClientError as exc:
             code, msg = self._parse_client_error(exc)
             raise DownloadError(
@@ -225,9 +602,154 @@ class ObjectsClient:
 
         return url
 
+    def get_download_urls(
+        self,
+        object_keys: Iterable[str],
+        expires_in: Optional[int] = None,
+    ) -> Dict[str, str]:
+        """
+        Generate pre-signed download URLs for several objects.
+
+        Shares the memoization of :meth:`get_download_url`.
+
+        Returns:
+            Dict mapping each object key to its pre-signed URL.
+
+        Raises:
+            DownloadError: If URL generation fails.
+        """
+        return {key: self.get_download_url(key, expires_in) for key in object_keys}
+
+    def download_with_fallback(self, object_key: str, local_path: str) -> str:
+        """
+        Download an object, falling back to its ``.dup`` copy if it is not visible yet.
+
+        The ``.dup`` copy is only tried when ``config.doublewrite`` is set: on
+        stores where a fresh write may briefly be missing from one replica,
+        the second copy hides that delay instead of failing the read.
+        Without doublewrite this is a plain download of ``object_key``.
+
+        Args:
+            object_key: Key of the object in the bucket.
+            local_path: Destination path for the downloaded file.
+
+        Returns:
+            The key that was actually read (``object_key`` or its ``.dup`` copy).
+
+        Raises:
+            DownloadError: If the object cannot be downloaded. When every copy
+                           is missing, the error names ``object_key``.
+        """
+        keys = [object_key]
+        if self.config.doublewrite:
+            keys.append(object_key + DOUBLEWRITE_SUFFIX)
+
+        not_found = None
+        for key in keys:
+            try:
+                self._s3.download_file(
+                    Bucket=self.config.bucket,
+                    Key=key,
+                    Filename=local_path,
+                    Config=self._transfer_config,
+                )
+                return key
+            except ClientError as exc:
+                code, msg = self._parse_client_error(exc)
+                if code not in _NOT_FOUND_CODES:
+                    raise DownloadError(
+                        f"Failed to download '{key}': {msg}",
+                        code=code,
+                        original=exc,
+                    ) from exc
+                not_found = not_found or exc
+
+        # Every copy is missing: report the key the caller asked for.
+        code, msg = self._parse_client_error(not_found)
+        raise DownloadError(
+            f"Failed to download '{object_key}': {msg}",
+            code=code,
+            original=not_found,
+        ) from not_found
+
+    def presign_many(
+        self,
+        object_keys: Iterable[str],
+        expires_in: Optional[int] = None,
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Lazily pre-sign download URLs for many objects with one reused signer.
+
+        Credentials, region and endpoint are resolved once up front instead of
+        per key, which suits bulk jobs such as baking thousands of CDN URLs.
+        Unlike :meth:`get_download_url`, results are not memoized.
+
+        Args:
+            object_keys: Keys of the objects in the bucket.
+            expires_in: URL validity in seconds. Defaults to ``config.default_expiry``.
+
+        Yields:
+            ``(object_key, url)`` pairs, in the order of ``object_keys``.
+        """
+        expiry = expires_in if expires_in is not None else self.config.default_expiry
+        credentials = self._s3._request_signer._credentials.get_frozen_credentials()
+        auth = S3SigV4QueryAuth(credentials, "s3", self._s3.meta.region_name, expires=expiry)
+        # Join endpoint and bucket the way botocore does, so endpoints with a
+        # path or a trailing slash sign the same path as _presign_get.
+        bucket_request = {"url_path": self._bucket_path, "query_string": {}, "headers": {}}
+        prepare_request_dict(bucket_request, endpoint_url=self._s3.meta.endpoint_url)
+        base_url = bucket_request["url"]
+
+        for key in object_keys:
+            request = AWSRequest(method="GET", url=base_url + percent_encode(key, safe="/~"))
+            auth.add_auth(request)
+            yield key, request.prepare().url
+
+    def fetch_many(
+        self,
+        object_keys: Iterable[str],
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, bytes]:
+        """
+        Download the contents of several objects concurrently into memory.
+
+        All workers share this client's connection pool, so the TLS
+        connections opened by earlier GETs are reused by later ones. That
+        pool holds ``max(config.max_pool_connections, 2 * config.max_workers)``
+        connections; more concurrent GETs than that would open connections
+        the pool cannot keep ("Connection pool is full" warnings), so workers
+        are capped at the pool size. The first failure cancels the GETs that
+        have not started yet.
+
+        Args:
+            object_keys: Keys of the objects to fetch.
+            max_workers: Number of parallel GETs. Defaults to ``config.max_workers``.
+
+        Returns:
+            Dict mapping each object key to its contents.
+
+        Raises:
+            DownloadError: If any object cannot be fetched.
+        """
+        pool_size = self._s3.meta.config.max_pool_connections
+        workers = min(max_workers or self.config.max_workers, pool_size)
+        contents = {}
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(self._fetch, key): key for key in object_keys}
+            try:
+                for future in as_completed(futures):
+                    contents[futures[future]] = future.result()
+            except BaseException:
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+
+        return contents
+
     def delete(self, object_key: str) -> None:
         """
-        Delete an object from the bucket.
+        Delete an object from the bucket, including its ``.dup`` copy
+        when ``config.doublewrite`` is set.
 
         Args:
             object_key: Key of the object to delete.
@@ -237,6 +759,8 @@ class ObjectsClient:
         """
         try:
             self._s3.delete_object(Bucket=self.config.bucket, Key=object_key)
+            if self.config.doublewrite:
+                self._s3.delete_object(Bucket=self.config.bucket, Key=object_key + DOUBLEWRITE_SUFFIX)
         except ClientError as exc:
             code, msg = self._parse_client_error(exc)
             raise ObjectsError(
@@ -245,19 +769,112 @@ class ObjectsClient:
                 original=exc,
             ) from exc
 
+    def delete_many(self, object_keys: Iterable[str], max_workers: Optional[int] = None) -> None:
+        """
+        Delete several objects using batched ``DeleteObjects`` requests.
+
+        Keys are sent 1000 per request; multiple batches run concurrently.
+        ``.dup`` copies are included when ``config.doublewrite`` is set.
+
+        Args:
+            object_keys: Keys of the objects to delete.
+            max_workers: Number of parallel batches. Defaults to ``config.max_workers``.
+
+        Raises:
+            DeleteError: If any key could not be deleted. ``errors`` holds the
+                         raw per-key error dicts and ``code`` is that of the
+                         first failure.
+            ObjectsError: If a batch request itself fails.
+        """
+        keys: Iterable[str] = object_keys
+        if self.config.doublewrite:
+            keys = (k for key in object_keys for k in (key, key + DOUBLEWRITE_SUFFIX))
+        workers = max_workers or self.config.max_workers
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            errors = [
+                error
+                for batch_errors in pool.map(self._delete_batch, _chunked(keys, DELETE_BATCH_SIZE))
+                for error in batch_errors
+            ]
+
+        if errors:
+            shown = ", ".join(
+                f"'{e.get('Key')}' ({e.get('Code', 'Unknown')})"
+                for e in errors[:DELETE_ERRORS_SHOWN]
+            )
+            more = len(errors) - DELETE_ERRORS_SHOWN
+            raise DeleteError(
+                f"Failed to delete {len(errors)} object(s): {shown}"
+                + (f" and {more} more" if more > 0 else ""),
+                errors=errors,
+                code=errors[0].get("Code", "Unknown"),
+            )
+
+    def open_object(self, object_key: str) -> Tuple[bool, Optional[StreamingBody]]:
+        """
+        Probe an object and fetch its first byte in a single request.
+
+        Issues ``GetObject`` with ``Range: bytes=0-0``, so a check-then-get
+        workflow saves the round-trip of a separate ``HeadObject``.
+
+        Returns:
+            ``(exists, stream)``. ``stream`` holds at most the first byte of
+            the object and must be closed by the caller; it is ``None`` when
+            the object does not exist or is empty.
+
+        Raises:
+            DownloadError: If the request fails for a reason other than a missing key.
+        """
+        try:
+            response = self._s3.get_object(
+                Bucket=self.config.bucket,
+                Key=object_key,
+                Range="bytes=0-0",
+            )
+        except ClientError as exc:
+            code, msg = self._parse_client_error(exc)
+            if code in _NOT_FOUND_CODES:
+                return False, None
+            if code in _EMPTY_RANGE_CODES:
+                return True, None
+            raise DownloadError(
+                f"Failed to open '{object_key}': {msg}",
+                code=code,
+                original=exc,
+            ) from exc
+
+        return True, response["Body"]
+
     def object_exists(self, object_key: str) -> bool:
         """
         Check whether an object exists in the bucket.
 
+        Lists at most one key under ``object_key`` as prefix, so a missing
+        object is an empty result rather than a raised ``ClientError``;
+        this keeps tight existence-check loops cheap. Requires list
+        permission on the bucket. Uses :meth:`open_object` instead when
+        ``config.exists_via_get`` is set.
+
         Returns:
             ``True`` if the object exists, ``False`` otherwise.
+
+        Raises:
+            ObjectsError: If the check request fails.
         """
+        if self.config.exists_via_get:
+            exists, stream = self.open_object(object_key)
+            if stream is not None:
+                stream.close()
+            return exists
+
         try:
-            self._s3.head_object(Bucket=self.config.bucket, Key=object_key)
-            return True
+            response = self._s3.list_objects_v2(
+                Bucket=self.config.bucket,
+                Prefix=object_key,
+                MaxKeys=1,
+            )
         except ClientError as exc:
-            if exc.response["Error"]["Code"] in ("404", "NoSuchKey"):
-                return False
             code, msg = self._parse_client_error(exc)
             raise ObjectsError(
                 f"Failed to check existence of '{object_key}': {msg}",
@@ -265,6 +882,9 @@ class ObjectsClient:
                 original=exc,
             ) from exc
 
+        # ``object_key`` itself sorts before any longer key sharing it as prefix.
+        return any(obj["Key"] == object_key for obj in response.get("Contents", []))
+
     # ------------------------------------------------------------------
     # Context manager support
     # ------------------------------------------------------------------
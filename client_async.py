@@ -0,0 +1,423 @@
+"""
+ate-dme.obst async client - asyncio counterpart of :class:`ObjectsClient`, backed by aioboto3.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from contextlib import AsyncExitStack
+from functools import partial
+from typing import Any, AsyncIterator, List, Optional, Tuple
+
+from botocore.exceptions import ClientError
+
+try:
+    import aioboto3
+    from aiobotocore.config import AioConfig
+except ImportError:  # optional dependency
+    aioboto3 = None
+
+from .client import (
+    DOUBLEWRITE_SUFFIX,
+    LIST_PAGE_SIZE,
+    ObjectInfo,
+    ObjectsClient,
+    ObjectsConfig,
+    _EMPTY_RANGE_CODES,
+    _NOT_FOUND_CODES,
+    _boto_config_options,
+    _build_transfer_config,
+    _clean_etag,
+    _get_key,
+    _get_object_fields,
+    _resolve_limit,
+    _upload_extra_args,
+)
+from .exceptions import DownloadError, ListError, ObjectsError, UploadError
+
+_parse_client_error = ObjectsClient._parse_client_error
+
+
+class AsyncObjectsClient:
+    """
+    Asyncio client for Domainesia/Neva Objects S3-compatible storage.
+
+    Requires the optional ``aioboto3`` package. The client must be opened
+    with ``async with`` (or :meth:`open`) before use. It honours the same
+    :class:`ObjectsConfig` fields as :class:`ObjectsClient` except
+    ``tcp_keepalive`` (aiohttp manages its own keep-alive) and
+    ``max_workers``, which only sizes the connection pool here: the
+    thread-pool batch helpers (``upload_many``, ``list_parallel``,
+    ``delete_many``, ``fetch_many``, ``presign_many``) are sync-only.
+
+    Example usage::
+
+        from dme_obst import AsyncObjectsClient
+        from dme_obst.client import ObjectsConfig
+
+        async with AsyncObjectsClient(config) as client:
+            await client.upload("./photo.jpg")
+            for obj in await client.list():
+                print(obj.key, obj.size)
+            url = await client.get_download_url("photo.jpg")
+    """
+
+    def __init__(self, config: ObjectsConfig) -> None:
+        if aioboto3 is None:
+            raise ImportError("AsyncObjectsClient requires aioboto3: pip install aioboto3")
+        self.config = config
+        self._session = aioboto3.Session()
+        self._transfer_config = _build_transfer_config(config)
+        self._stack: Optional[AsyncExitStack] = None
+        self._s3 = None
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    @property
+    def _client(self):
+        if self._s3 is None:
+            raise RuntimeError("AsyncObjectsClient is not open; use 'async with' or await open()")
+        return self._s3
+
+    async def _iter_pages(
+        self, prefix: str = "", page_size: int = LIST_PAGE_SIZE, **kwargs
+    ) -> AsyncIterator[dict]:
+        """Yield raw ``list_objects_v2`` pages, following continuation tokens."""
+        paginator = self._client.get_paginator("list_objects_v2")
+        pages = paginator.paginate(
+            Bucket=self.config.bucket,
+            Prefix=prefix,
+            PaginationConfig={"PageSize": page_size},
+            **kwargs,
+        )
+        try:
+            async for page in pages:
+                yield page
+        except ClientError as exc:
+            code, msg = _parse_client_error(exc)
+            raise ListError(f"Failed to list objects: {msg}", code=code, original=exc) from exc
+
+    async def _discard(self, object_key: str) -> None:
+        """Best-effort delete used to clean up after a failed write."""
+        try:
+            await self._client.delete_object(Bucket=self.config.bucket, Key=object_key)
+        except ClientError:
+            pass
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def open(self) -> "AsyncObjectsClient":
+        """Create the underlying aiobotocore client and its HTTP session."""
+        if self._s3 is None:
+            stack = AsyncExitStack()
+            self._s3 = await stack.enter_async_context(
+                self._session.client(
+                    "s3",
+                    endpoint_url=self.config.endpoint,
+                    aws_access_key_id=self.config.access_key,
+                    aws_secret_access_key=self.config.secret_key,
+                    config=AioConfig(**_boto_config_options(self.config)),
+                )
+            )
+            self._stack = stack
+        return self
+
+    async def close(self) -> None:
+        """Close the underlying client and release its connections."""
+        if self._stack is not None:
+            stack, self._stack, self._s3 = self._stack, None, None
+            await stack.aclose()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def upload(
+        self,
+        local_path: str,
+        object_key: Optional[str] = None,
+        extra_args: Optional[dict] = None,
+    ) -> str:
+        """
+        Upload a local file to the bucket. See :meth:`ObjectsClient.upload`.
+
+        Raises:
+            FileNotFoundError: If ``local_path`` does not exist.
+            UploadError: If the upload fails.
+        """
+        if not os.path.isfile(local_path):
+            raise FileNotFoundError(f"File not found: {local_path}")
+
+        key = object_key or os.path.basename(local_path)
+
+        put = partial(
+            self._client.upload_file,
+            Filename=local_path,
+            Bucket=self.config.bucket,
+            ExtraArgs=_upload_extra_args(self.config, extra_args),
+            Config=self._transfer_config,
+        )
+
+        try:
+            if self.config.doublewrite:
+                dup_key = key + DOUBLEWRITE_SUFFIX
+                results = await asyncio.gather(
+                    put(Key=key), put(Key=dup_key), return_exceptions=True
+                )
+                errors = [r for r in results if isinstance(r, BaseException)]
+                if errors:
+                    # Never leave a .dup that download_with_fallback could serve
+                    # for a write that failed.
+                    await self._discard(dup_key)
+                    raise errors[0]
+            else:
+                await put(Key=key)
+        except ClientError as exc:
+            code, msg = _parse_client_error(exc)
+            raise UploadError(f"Upload failed for '{local_path}': {msg}", code=code, original=exc) from exc
+
+        return key
+
+    async def iter_objects(
+        self, prefix: str = "", page_size: int = LIST_PAGE_SIZE
+    ) -> AsyncIterator[ObjectInfo]:
+        """
+        Lazily iterate over every object in the bucket. See :meth:`ObjectsClient.iter_objects`.
+
+        Raises:
+            ListError: If a listing request fails.
+        """
+        async for page in self._iter_pages(prefix, page_size):
+            for obj in page.get("Contents", []):
+                key, size, last_modified = _get_object_fields(obj)
+                yield ObjectInfo(key, size, last_modified, _clean_etag(obj.get("ETag", "")))
+
+    async def list(
+        self,
+        prefix: str = "",
+        limit: Optional[int] = None,
+        max_keys: Optional[int] = None,
+    ) -> List[ObjectInfo]:
+        """
+        List objects in the bucket. See :meth:`ObjectsClient.list`.
+
+        Raises:
+            ListError: If the listing request fails.
+        """
+        limit = _resolve_limit(limit, max_keys)
+        objects: List[ObjectInfo] = []
+        if limit is not None and limit <= 0:
+            return objects
+        page_size = LIST_PAGE_SIZE if limit is None else min(limit, LIST_PAGE_SIZE)
+        async for obj in self.iter_objects(prefix, page_size):
+            objects.append(obj)
+            if len(objects) == limit:
+                break
+        return objects
+
+    async def list_keys(self, prefix: str = "") -> List[str]:
+        """
+        Convenience method that returns only object keys.
+
+        Returns:
+            List of string keys.
+
+        Raises:
+            ListError: If the listing request fails.
+        """
+        return [
+            _get_key(obj)
+            async for page in self._iter_pages(prefix)
+            for obj in page.get("Contents", [])
+        ]
+
+    async def list_prefixes(self, prefix: str = "", delimiter: str = "/") -> List[str]:
+        """
+        List the "folders" directly below ``prefix``. See :meth:`ObjectsClient.list_prefixes`.
+
+        Raises:
+            ListError: If the listing request fails.
+        """
+        return [
+            common["Prefix"]
+            async for page in self._iter_pages(prefix, Delimiter=delimiter)
+            for common in page.get("CommonPrefixes", [])
+        ]
+
+    async def get_download_url(
+        self,
+        object_key: str,
+        expires_in: Optional[int] = None,
+    ) -> str:
+        """
+        Generate a pre-signed download URL for an object.
+
+        Raises:
+            DownloadError: If URL generation fails.
+        """
+        expiry = expires_in if expires_in is not None else self.config.default_expiry
+
+        try:
+            url = await self._client.generate_presigned_url(
+                "get_object",
+                Params={"Bucket": self.config.bucket, "Key": object_key},
+                ExpiresIn=expiry,
+            )
+        except ClientError as exc:
+            code, msg = _parse_client_error(exc)
+            raise DownloadError(
+                f"Failed to generate URL for '{object_key}': {msg}",
+                code=code,
+                original=exc,
+            ) from exc
+
+        return url
+
+    async def download_with_fallback(self, object_key: str, local_path: str) -> str:
+        """
+        Download an object, falling back to its ``.dup`` copy if it is not visible yet.
+        See :meth:`ObjectsClient.download_with_fallback`.
+
+        Raises:
+            DownloadError: If the object cannot be downloaded. When every copy
+                           is missing, the error names ``object_key``.
+        """
+        keys = [object_key]
+        if self.config.doublewrite:
+            keys.append(object_key + DOUBLEWRITE_SUFFIX)
+
+        not_found = None
+        for key in keys:
+            try:
+                await self._client.download_file(
+                    Bucket=self.config.bucket,
+                    Key=key,
+                    Filename=local_path,
+                    Config=self._transfer_config,
+                )
+                return key
+            except ClientError as exc:
+                code, msg = _parse_client_error(exc)
+                if code not in _NOT_FOUND_CODES:
+                    raise DownloadError(
+                        f"Failed to download '{key}': {msg}",
+                        code=code,
+                        original=exc,
+                    ) from exc
+                not_found = not_found or exc
+
+        # Every copy is missing: report the key the caller asked for.
+        code, msg = _parse_client_error(not_found)
+        raise DownloadError(
+            f"Failed to download '{object_key}': {msg}",
+            code=code,
+            original=not_found,
+        ) from not_found
+
+    async def delete(self, object_key: str) -> None:
+        """
+        Delete an object from the bucket, including its ``.dup`` copy
+        when ``config.doublewrite`` is set.
+
+        Raises:
+            ObjectsError: If deletion fails.
+        """
+        try:
+            await self._client.delete_object(Bucket=self.config.bucket, Key=object_key)
+            if self.config.doublewrite:
+                await self._client.delete_object(
+                    Bucket=self.config.bucket, Key=object_key + DOUBLEWRITE_SUFFIX
+                )
+        except ClientError as exc:
+            code, msg = _parse_client_error(exc)
+            raise ObjectsError(
+                f"Failed to delete '{object_key}': {msg}",
+                code=code,
+                original=exc,
+            ) from exc
+
+    async def open_object(self, object_key: str) -> Tuple[bool, Optional[Any]]:
+        """
+        Probe an object and fetch its first byte in a single request.
+        See :meth:`ObjectsClient.open_object`.
+
+        Returns:
+            ``(exists, stream)``. ``stream`` is an aiobotocore streaming body
+            (``await stream.read()``) that the caller must close; it is
+            ``None`` when the object does not exist or is empty.
+
+        Raises:
+            DownloadError: If the request fails for a reason other than a missing key.
+        """
+        try:
+            response = await self._client.get_object(
+                Bucket=self.config.bucket,
+                Key=object_key,
+                Range="bytes=0-0",
+            )
+        except ClientError as exc:
+            code, msg = _parse_client_error(exc)
+            if code in _NOT_FOUND_CODES:
+                return False, None
+            if code in _EMPTY_RANGE_CODES:
+                return True, None
+            raise DownloadError(
+                f"Failed to open '{object_key}': {msg}",
+                code=code,
+                original=exc,
+            ) from exc
+
+        return True, response["Body"]
+
+    async def object_exists(self, object_key: str) -> bool:
+        """
+        Check whether an object exists in the bucket. See :meth:`ObjectsClient.object_exists`.
+
+        Returns:
+            ``True`` if the object exists, ``False`` otherwise.
+
+        Raises:
+            ObjectsError: If the check request fails.
+        """
+        if self.config.exists_via_get:
+            exists, stream = await self.open_object(object_key)
+            if stream is not None:
+                stream.close()
+            return exists
+
+        try:
+            response = await self._client.list_objects_v2(
+                Bucket=self.config.bucket,
+                Prefix=object_key,
+                MaxKeys=1,
+            )
+        except ClientError as exc:
+            code, msg = _parse_client_error(exc)
+            raise ObjectsError(
+                f"Failed to check existence of '{object_key}': {msg}",
+                code=code,
+                original=exc,
+            ) from exc
+
+        return any(obj["Key"] == object_key for obj in response.get("Contents", []))
+
+    # ------------------------------------------------------------------
+    # Context manager support
+    # ------------------------------------------------------------------
+
+    async def __aenter__(self) -> "AsyncObjectsClient":
+        return await self.open()
+
+    async def __aexit__(self, *_) -> None:
+        await self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"AsyncObjectsClient(bucket={self.config.bucket!r}, "
+            f"endpoint={self.config.endpoint!r})"
+        )
@@ -26,4 +26,12 @@ class DownloadError(ObjectsError):
 
 
 class ListError(ObjectsError):
-    """Raised when listing bucket objects fails."""
\ No newline at end of file
+    """Raised when listing bucket objects fails."""
+
+
+class DeleteError(ObjectsError):
+    """Raised when a batch delete leaves some objects undeleted."""
+
+    def __init__(self, message: str, errors: list, code: str = "", original: Exception = None):
+        super().__init__(message, code=code, original=original)
+        self.errors = errors
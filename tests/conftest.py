@@ -0,0 +1,14 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+# The repository root is the package itself; import it as ``dme_obst``.
+ROOT = Path(__file__).resolve().parent.parent
+
+if "dme_obst" not in sys.modules:
+    spec = importlib.util.spec_from_file_location(
+        "dme_obst", ROOT / "__init__.py", submodule_search_locations=[str(ROOT)]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["dme_obst"] = module
+    spec.loader.exec_module(module)
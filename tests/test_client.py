@@ -0,0 +1,269 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import botocore.auth
+import pytest
+from botocore.exceptions import ClientError
+from botocore.stub import ANY, Stubber
+
+from dme_obst import DeleteError, DownloadError, UploadError
+from dme_obst import client as client_module
+from dme_obst.client import ObjectsClient, ObjectsConfig
+
+
+def make_client(**kwargs) -> ObjectsClient:
+    return ObjectsClient(ObjectsConfig("access", "secret", "bucket", **kwargs))
+
+
+@pytest.fixture
+def frozen_clock(monkeypatch):
+    now = datetime(2024, 1, 1, 12, 0, 0)
+    monkeypatch.setattr(botocore.auth, "get_current_datetime", lambda *_, **__: now)
+
+
+def reference_url(client: ObjectsClient, key: str, expiry: int) -> str:
+    return client._s3.generate_presigned_url(
+        "get_object", Params={"Bucket": "bucket", "Key": key}, ExpiresIn=expiry
+    )
+
+
+PRESIGN_KEYS = ["photo.jpg", "dir/a b.jpg", "a+b.txt", "100%.txt", "fotó/ü.jpg", "/leading"]
+
+
+@pytest.mark.parametrize("key", PRESIGN_KEYS)
+def test_presign_get_matches_generate_presigned_url(frozen_clock, key):
+    client = make_client()
+
+    url = client._presign_get(key, 3600)
+
+    assert "X-Amz-Date=20240101T120000Z" in url
+    assert url == reference_url(client, key, 3600)
+
+
+@pytest.mark.parametrize(
+    "endpoint",
+    ["https://s3.nevaobjects.id", "https://s3.nevaobjects.id/", "https://h.example/s3/"],
+)
+def test_presign_many_matches_generate_presigned_url(frozen_clock, endpoint):
+    client = make_client(endpoint=endpoint)
+
+    urls = dict(client.presign_many(PRESIGN_KEYS, expires_in=600))
+
+    assert list(urls) == PRESIGN_KEYS
+    for key, url in urls.items():
+        assert url == reference_url(client, key, 600)
+        assert url == client._presign_get(key, 600)
+
+
+def test_get_download_url_memoized_per_quarter_window(monkeypatch):
+    clock = [1_700_000_000.0]  # start of a 100 s window for expiry=400
+    monkeypatch.setattr(client_module, "time", SimpleNamespace(time=lambda: clock[0]))
+    monkeypatch.setattr(
+        botocore.auth,
+        "get_current_datetime",
+        lambda *_, **__: datetime.fromtimestamp(clock[0], timezone.utc).replace(tzinfo=None),
+    )
+    client = make_client()
+
+    first = client.get_download_url("photo.jpg", expires_in=400)
+    clock[0] += 99
+    assert client.get_download_url("photo.jpg", expires_in=400) == first
+
+    clock[0] += 1
+    renewed = client.get_download_url("photo.jpg", expires_in=400)
+    assert renewed != first
+    assert renewed == reference_url(client, "photo.jpg", 400)
+
+
+def test_upload_many_returns_failed_upload_as_pair(tmp_path):
+    ok, denied = tmp_path / "ok.txt", tmp_path / "denied.txt"
+    ok.write_bytes(b"ok")
+    denied.write_bytes(b"denied")
+    client = make_client()
+
+    with Stubber(client._s3) as stub:
+        stub.add_response("put_object", {}, {"Bucket": "bucket", "Key": "ok.txt", "Body": ANY})
+        stub.add_client_error("put_object", "AccessDenied", "denied", http_status_code=403)
+        results = dict(client.upload_many([str(ok), str(denied)], max_workers=1))
+
+    assert results[str(ok)] == "ok.txt"
+    error = results[str(denied)]
+    assert isinstance(error, UploadError)
+    assert error.code == "AccessDenied"
+
+
+def test_upload_many_caps_part_threads_to_pool():
+    client = make_client(max_pool_connections=64)
+    captured = []
+    client._upload = lambda path, key, extra, transfer_config: captured.append(transfer_config)
+
+    client.upload_many(["a"], max_workers=16)
+
+    assert captured[0].max_concurrency == 64 // 16
+
+
+def test_fetch_many_caps_workers_to_pool(monkeypatch):
+    client = make_client(max_pool_connections=4, max_workers=2)
+    captured = []
+
+    class RecordingPool(ThreadPoolExecutor):
+        def __init__(self, max_workers):
+            captured.append(max_workers)
+            super().__init__(max_workers=max_workers)
+
+    monkeypatch.setattr(client_module, "ThreadPoolExecutor", RecordingPool)
+    client._fetch = lambda key: key.encode()
+
+    assert client.fetch_many(["a", "b"], max_workers=32) == {"a": b"a", "b": b"b"}
+    assert captured == [client._s3.meta.config.max_pool_connections]
+
+
+def test_fetch_many_cancels_pending_on_first_error():
+    client = make_client()
+    fetched = []
+
+    def fake_fetch(key):
+        fetched.append(key)
+        if key == "bad":
+            raise DownloadError("missing")
+        time.sleep(0.05)
+        return b""
+
+    client._fetch = fake_fetch
+
+    with pytest.raises(DownloadError):
+        client.fetch_many(["bad"] + [f"k{i}" for i in range(50)], max_workers=1)
+
+    assert len(fetched) < 51
+
+
+def _listing(*keys):
+    return {
+        "Contents": [
+            {"Key": k, "Size": 1, "LastModified": datetime(2024, 1, 1), "ETag": '"e"'}
+            for k in keys
+        ],
+        "IsTruncated": False,
+    }
+
+
+def test_list_limit_requests_only_needed_page_size():
+    client = make_client()
+
+    with Stubber(client._s3) as stub:
+        stub.add_response(
+            "list_objects_v2",
+            _listing("a", "b"),
+            {"Bucket": "bucket", "Prefix": "", "MaxKeys": 2},
+        )
+        objects = client.list(limit=2)
+
+    assert [o.key for o in objects] == ["a", "b"]
+
+
+def test_list_accepts_max_keys_alias():
+    client = make_client()
+
+    with Stubber(client._s3) as stub:
+        stub.add_response(
+            "list_objects_v2",
+            _listing("a"),
+            {"Bucket": "bucket", "Prefix": "", "MaxKeys": 10},
+        )
+        objects = client.list(max_keys=10)
+
+    assert [o.key for o in objects] == ["a"]
+
+
+def test_doublewrite_failure_removes_dup(tmp_path):
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(b"data")
+    client = make_client(doublewrite=True)
+
+    with Stubber(client._s3) as stub:
+        # The two PUTs race, so either copy may be the one that fails.
+        stub.add_client_error("put_object", "AccessDenied", "denied", http_status_code=403)
+        stub.add_response("put_object", {}, None)
+        stub.add_response("delete_object", {}, {"Bucket": "bucket", "Key": "photo.jpg.dup"})
+        with pytest.raises(UploadError):
+            client.upload(str(path))
+        stub.assert_no_pending_responses()
+
+
+def test_lazy_client_is_built_once_across_threads():
+    client = make_client()
+    built = []
+    build = client._build_client
+
+    def counting_build():
+        built.append(None)
+        time.sleep(0.01)
+        return build()
+
+    client._build_client = counting_build
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        clients = list(pool.map(lambda _: client._s3, range(16)))
+
+    assert len(built) == 1
+    assert all(c is clients[0] for c in clients)
+
+
+def test_delete_many_reports_errors_without_listing_every_key():
+    client = make_client()
+    failures = [{"Key": f"k{i}", "Code": "AccessDenied", "Message": "no"} for i in range(50)]
+
+    with Stubber(client._s3) as stub:
+        stub.add_response("delete_objects", {"Errors": failures}, None)
+        with pytest.raises(DeleteError) as raised:
+            client.delete_many([f"k{i}" for i in range(50)])
+
+    error = raised.value
+    assert error.errors == failures
+    assert error.code == "AccessDenied"
+    assert "50 object(s)" in str(error)
+    assert "k4'" in str(error) and "k5'" not in str(error)
+    assert "45 more" in str(error)
+
+
+def test_max_attempts_counts_total_attempts():
+    client = make_client(max_attempts=5)
+
+    assert client._s3.meta.config.retries["total_max_attempts"] == 5
+
+
+def _missing_download(tried):
+    # s3transfer versions differ in whether they probe with HeadObject or
+    # GetObject first, so stub the transfer call itself.
+    def download_file(Bucket, Key, Filename, Config=None):
+        tried.append(Key)
+        raise ClientError({"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject")
+
+    return download_file
+
+
+def test_download_with_fallback_skips_dup_without_doublewrite(tmp_path):
+    client = make_client()
+    tried = []
+    client._s3.download_file = _missing_download(tried)
+
+    with pytest.raises(DownloadError) as raised:
+        client.download_with_fallback("photo.jpg", str(tmp_path / "out"))
+
+    assert tried == ["photo.jpg"]
+    assert "'photo.jpg'" in str(raised.value)
+
+
+def test_download_with_fallback_reports_primary_key_when_all_missing(tmp_path):
+    client = make_client(doublewrite=True)
+    tried = []
+    client._s3.download_file = _missing_download(tried)
+
+    with pytest.raises(DownloadError) as raised:
+        client.download_with_fallback("photo.jpg", str(tmp_path / "out"))
+
+    assert tried == ["photo.jpg", "photo.jpg.dup"]
+    assert raised.value.code == "404"
+    assert "'photo.jpg'" in str(raised.value)
+    assert ".dup" not in str(raised.value)
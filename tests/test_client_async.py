@@ -0,0 +1,117 @@
+import asyncio
+import io
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("aioboto3")
+
+from aiobotocore.stub import AioStubber  # noqa: E402
+from botocore.stub import ANY  # noqa: E402
+
+from dme_obst import AsyncObjectsClient, UploadError  # noqa: E402
+from dme_obst.client import ObjectsConfig  # noqa: E402
+
+
+
+def _listing(*keys):
+    return {
+        "Contents": [{"Key": k, "Size": 1, "LastModified": datetime(2024, 1, 1)} for k in keys],
+        "IsTruncated": False,
+    }
+
+
+def make_client(**kwargs) -> AsyncObjectsClient:
+    return AsyncObjectsClient(ObjectsConfig("access", "secret", "bucket", **kwargs))
+
+
+def test_open_and_close():
+    async def scenario():
+        client = make_client()
+        with pytest.raises(RuntimeError):
+            client._client
+        async with client as opened:
+            assert opened is client
+            assert client._s3 is not None
+        assert client._s3 is None
+
+    asyncio.run(scenario())
+
+
+def test_list_paginates_and_honours_limit():
+    async def scenario():
+        async with make_client() as client:
+            with AioStubber(client._s3) as stub:
+                stub.add_response(
+                    "list_objects_v2",
+                    {**_listing("a", "b"), "IsTruncated": True, "NextContinuationToken": "t"},
+                    {"Bucket": "bucket", "Prefix": "", "MaxKeys": 1000},
+                )
+                stub.add_response(
+                    "list_objects_v2",
+                    _listing("c"),
+                    {"Bucket": "bucket", "Prefix": "", "MaxKeys": 1000, "ContinuationToken": "t"},
+                )
+                stub.add_response(
+                    "list_objects_v2",
+                    _listing("a"),
+                    {"Bucket": "bucket", "Prefix": "", "MaxKeys": 1},
+                )
+                keys = await client.list_keys()
+                limited = await client.list(limit=1)
+        return keys, limited
+
+    keys, limited = asyncio.run(scenario())
+    assert keys == ["a", "b", "c"]
+    assert [o.key for o in limited] == ["a"]
+
+
+def test_upload_passes_transfer_config(tmp_path):
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(b"data")
+
+    async def scenario():
+        async with make_client() as client:
+            with AioStubber(client._s3) as stub:
+                stub.add_response("put_object", {}, {"Bucket": "bucket", "Key": "photo.jpg", "Body": ANY})
+                stub.add_client_error("put_object", "AccessDenied", "denied", http_status_code=403)
+                key = await client.upload(str(path))
+                with pytest.raises(UploadError) as failed:
+                    await client.upload(str(path))
+        return key, failed.value
+
+    key, error = asyncio.run(scenario())
+    assert key == "photo.jpg"
+    assert error.code == "AccessDenied"
+
+
+def test_object_exists_via_get():
+    async def scenario():
+        async with make_client(exists_via_get=True) as client:
+            with AioStubber(client._s3) as stub:
+                stub.add_response(
+                    "get_object",
+                    {"Body": io.BytesIO(b"x")},
+                    {"Bucket": "bucket", "Key": "k", "Range": "bytes=0-0"},
+                )
+                stub.add_client_error("get_object", "NoSuchKey", http_status_code=404)
+                return await client.object_exists("k"), await client.object_exists("k")
+
+    assert asyncio.run(scenario()) == (True, False)
+
+
+def test_doublewrite_failure_removes_dup(tmp_path):
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(b"data")
+
+    async def scenario():
+        async with make_client(doublewrite=True) as client:
+            with AioStubber(client._s3) as stub:
+                stub.add_client_error("put_object", "AccessDenied", "denied", http_status_code=403)
+                stub.add_response("put_object", {}, None)
+                stub.add_response("delete_object", {}, {"Bucket": "bucket", "Key": "photo.jpg.dup"})
+                with pytest.raises(UploadError):
+                    await client.upload(str(path))
+                stub.assert_no_pending_responses()
+
+    asyncio.run(scenario())